@@ -17,13 +17,40 @@
 
 import requests
 from collections import namedtuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 GITHUB_GRAPHQL = 'https://api.github.com/graphql'
-GITHUB_BASE_REST_API = 'https://api.github.com/repos'
+REQUEST_TIMEOUT = 30
+
+PullRequestReviewStatus = namedtuple('PullRequestReviewStatus', ['title', 'outcome', 'reviews'])
+PullRequestDetails = namedtuple('PullRequestDetails', ['title', 'outcome', 'reviews', 'closing_issues'])
+
+# Shared session so consecutive GitHub calls reuse the same keep-alive connection
+# instead of paying a new TCP/TLS handshake each time. GraphQL queries here are
+# read-only, so POST is safe to retry on transient gateway errors.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=frozenset({'GET', 'POST'})),
+))
+
+
+def get_session(token):
+    """
+    Return the shared GitHub session, authenticated with the given token.
+    """
+    auth = f"Bearer {token}"
+    if _SESSION.headers.get("Authorization") != auth:
+        _SESSION.headers["Authorization"] = auth
+    return _SESSION
+
 
 def __post_query(token, query, vars):
-    headers = {"Authorization": f"Bearer {token}"}
-    request = requests.post(GITHUB_GRAPHQL, json={'query': query, 'variables': vars}, headers=headers)
+    request = get_session(token).post(GITHUB_GRAPHQL, json={'query': query, 'variables': vars},
+                                      timeout=REQUEST_TIMEOUT)
     if request.status_code == 200:
         return request.json().get('data')
     else:
@@ -89,21 +116,117 @@ def get_pr_review_status(token, owner, repo, pr):
     """
     data = __post_query(token, query, vars)
     pr_data = data.get('repository').get('pullRequest')
-    reviews = [review.get('state') for review in pr_data.get("latestReviews").get("nodes")]
-    result = {"title": pr_data.get('title'), "outcome": pr_data.get('reviewDecision'), "reviews": reviews}
-    return namedtuple('Struct', result.keys())(*result.values())
+    return PullRequestReviewStatus(
+        title=pr_data.get('title'),
+        outcome=pr_data.get('reviewDecision'),
+        reviews=[review.get('state') for review in pr_data.get('latestReviews').get('nodes')],
+    )
+
+
+def get_pr_full(token, owner, repo, pr):
+    """
+    Fetch the review status and closing issues of a PR in a single query.
+    """
+    vars = {"owner": owner, "repo": repo, "pr": pr}
+    query = """
+        query($owner:String!, $repo:String!, $pr:Int!) {
+            repository (owner: $owner, name: $repo) {
+                pullRequest (number: $pr) {
+                    title,
+                    reviewDecision,
+                    latestReviews (last: 10) {
+                        nodes {
+                            state
+                        }
+                    }
+                    closingIssuesReferences (first: 10) {
+                        nodes {
+                            number
+                            title
+                        }
+                    }
+                }
+            }
+        }
+    """
+    data = __post_query(token, query, vars)
+    pr_data = data.get('repository').get('pullRequest')
+    return PullRequestDetails(
+        title=pr_data.get('title'),
+        outcome=pr_data.get('reviewDecision'),
+        reviews=[review.get('state') for review in pr_data.get('latestReviews').get('nodes')],
+        closing_issues=pr_data.get('closingIssuesReferences').get('nodes'),
+    )
+
+
+def list_open_prs_with_author_association(token, owner, repo, first=100, after=None):
+    """
+    Fetch one page of open PRs, newest first, with the fields needed to mirror them to Jira.
+    Returns the pullRequests connection with its 'nodes' and 'pageInfo'.
+    """
+    vars = {"owner": owner, "repo": repo, "first": first, "after": after}
+    query = """
+        query($owner:String!, $repo:String!, $first:Int!, $after:String) {
+            repository (owner: $owner, name: $repo) {
+                pullRequests (
+                    first: $first, after: $after, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}
+                ) {
+                    nodes {
+                        number
+                        title
+                        body
+                        url
+                        state
+                        authorAssociation
+                        author {
+                            login
+                            url
+                        }
+                        labels (first: 20) {
+                            nodes {
+                                name
+                            }
+                        }
+                    }
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                }
+            }
+        }
+    """
+    data = __post_query(token, query, vars)
+    return data.get('repository').get('pullRequests')
 
 
-def get_recently_updated_pr_url(token, owner, repo):
+def get_recently_updated_pr_issue(token, owner, repo):
+    """
+    Fetch the most recently updated PR, shaped like a REST issue payload with the fields used for syncing.
+    """
     vars = {"owner": owner, "repo": repo}
     query = """
         query($owner:String!, $repo:String!) {
             repository (owner: $owner, name: $repo) {
                 pullRequests (last:1 orderBy: {field: UPDATED_AT, direction: ASC} ) {
                     nodes {
-                        title
                         number
-                        updatedAt
+                        title
+                        body
+                        url
+                        state
+                        author {
+                            login
+                            url
+                        }
+                        labels (first: 50) {
+                            nodes {
+                                name
+                            }
+                        }
+                        comments {
+                            totalCount
+                        }
                     }
                 }
             }
@@ -111,6 +234,24 @@ def get_recently_updated_pr_url(token, owner, repo):
     """
     data = __post_query(token, query, vars)
     nodes = data.get('repository', {}).get('pullRequests', {}).get('nodes', None)
-    if nodes is None:
+    if not nodes:
         return None
-    return f"{GITHUB_BASE_REST_API}/{owner}/{repo}/issues/{nodes[0].get('number')}"
\ No newline at end of file
+    return pr_node_to_issue(nodes[0])
+
+
+def pr_node_to_issue(pr):
+    """
+    Convert a pullRequest node to the REST issue shape used when syncing, e.g. gh_issue['user']['login'].
+    """
+    author = pr.get('author') or {'login': 'ghost', 'url': 'https://github.com/ghost'}
+    return {
+        'pull_request': True,
+        'labels': [{'name': lbl.get('name')} for lbl in pr.get('labels').get('nodes')],
+        'number': pr.get('number'),
+        'title': pr.get('title'),
+        'html_url': pr.get('url'),
+        'user': {'login': author.get('login'), 'html_url': author.get('url')},
+        'state': pr.get('state').lower(),
+        'body': pr.get('body'),
+        'comments': pr.get('comments', {}).get('totalCount', 0),
+    }
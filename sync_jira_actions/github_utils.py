@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+#
+# Copyright: (c) 2026, Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+from functools import lru_cache
+
+import orjson
+from github import Github
+
+from github_graphql import REQUEST_TIMEOUT, get_session
+
+GITHUB_BASE_REST_API = 'https://api.github.com/repos'
+
+
+@lru_cache(maxsize=1)
+def get_github():
+    """Return the GitHub client for this run, created on first use."""
+    return Github(os.environ['GITHUB_TOKEN'])
+
+
+def get_owner_and_repo():
+    """Return the (owner, name) of the repository the action runs in, without any API call."""
+    owner, repo = os.environ['GITHUB_REPOSITORY'].split('/', 1)
+    return owner, repo
+
+
+@lru_cache(maxsize=1)
+def get_repo():
+    """Return the repository the action runs in, fetched once per run."""
+    return get_github().get_repo(os.environ['GITHUB_REPOSITORY'])
+
+
+@lru_cache(maxsize=128)
+def is_collaborator(login: str) -> bool:
+    """Return True when the user is a collaborator on the repository.
+
+    Cached per login, as many PRs scanned in one run usually share authors.
+    """
+    return get_repo().has_in_collaborators(login)
+
+
+def get_json(token, url):
+    """Return a GitHub REST resource as JSON, fetched over the shared session."""
+    request = get_session(token).get(url, timeout=REQUEST_TIMEOUT)
+    if request.status_code != 200:
+        raise Exception("GET {} failed by returning code of {}.".format(url, request.status_code))
+    return orjson.loads(request.content)
+
+
+def update_issue_title(token, owner, repo, number, title):
+    """Set the title of an issue or PR with a single REST PATCH, without fetching it first."""
+    url = f"{GITHUB_BASE_REST_API}/{owner}/{repo}/issues/{number}"
+    request = get_session(token).patch(url, json={'title': title}, timeout=REQUEST_TIMEOUT)
+    if request.status_code != 200:
+        raise Exception("Failed to update title of #{} by returning code of {}.".format(number, request.status_code))
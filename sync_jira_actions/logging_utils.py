@@ -37,9 +37,11 @@ def is_debug() -> bool:
     """Return True when GitHub Actions runner debug logging is enabled.
 
     Set ``ACTIONS_RUNNER_DEBUG: true`` in your workflow ``env:`` block to
-    enable verbose payload logging. See README for caveats around public repos.
+    enable verbose payload logging. GitHub also sets ``RUNNER_DEBUG=1`` when a
+    run is re-run with debug logging enabled. See README for caveats around
+    public repos.
     """
-    return os.environ.get('ACTIONS_RUNNER_DEBUG') == 'true'
+    return os.environ.get('ACTIONS_RUNNER_DEBUG') == 'true' or os.environ.get('RUNNER_DEBUG') == '1'
 
 
 def redact(text: str) -> str:
@@ -23,8 +23,8 @@ import tempfile
 import time
 
 from logging_utils import is_debug
+from github_utils import get_github, get_repo
 
-from github import Github
 from github.GithubException import GithubException
 from jira import JIRAError
 
@@ -32,10 +32,10 @@ from jira import JIRAError
 JIRA_NEW_FEATURE_TYPE_ID = 10101
 # 10004 is ID for Bug issue type in Jira.
 JIRA_BUG_TYPE_ID = 10004
-# Initialize GitHub instance
-GITHUB = Github(os.environ['GITHUB_TOKEN'])
-# Initialize GitHub repository
-REPO = GITHUB.get_repo(os.environ['GITHUB_REPOSITORY'])
+# Initialize GitHub instance (shared with the rest of the action)
+GITHUB = get_github()
+# Initialize GitHub repository (fetched once per run)
+REPO = get_repo()
 # Set the number of retries before deciding Jira issue does not exist.
 FIND_JIRA_RETRIES = int(os.environ.get('INPUT_FIND_JIRA_RETRIES', 5))
 
@@ -469,6 +469,8 @@ def _find_jira_issue(jira, gh_issue, gh_repo, make_new=False, retries=FIND_JIRA_
     again). This is useful because often events on a GitHub issue come in a
     flurry (for example if someone creates and then edits or labels an issue),
     # and they're not always processed in order.
+
+    Unless make_new is set, gh_issue only needs the 'html_url' and 'title' keys.
     """
     url = gh_issue['html_url']
     jql_query = f'issue in issuesWithRemoteLinksByGlobalId("{url}") OR issue in workItemsWithRemoteLinksByGlobalId("{url}") order by updated desc'
@@ -17,16 +17,24 @@
 #
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from jira import JIRA
-from github import Github
+from jira import JIRAError
+from github_utils import get_owner_and_repo, is_collaborator, update_issue_title
 from sync_issue import _create_jira_issue
 from sync_issue import _find_jira_issue
-from github_graphql import find_closing_issues, get_pr_review_status
+from github_graphql import find_closing_issues, get_pr_review_status, list_open_prs_with_author_association
+from github_graphql import pr_node_to_issue
 from logging_utils import redact
 
 # The minimum number of approvals before a PR is ready to merge.
 MINIMUM_APPROVALS = int(os.environ.get('INPUT_MINIMUM_APPROVALS', 3))
+# Concurrent Jira requests when moving linked issues and looking up issues for remaining PRs.
+JIRA_TRANSITION_WORKERS = 8
+JIRA_LOOKUP_WORKERS = 8
+# PR author associations that are always collaborators, whose PRs are skipped without a REST check.
+COLLABORATOR_ASSOCIATIONS = {'MEMBER', 'OWNER', 'COLLABORATOR'}
 
 SIMPLE_TRANSITIONS = {
     "review_status": "Review in progress",
@@ -50,113 +58,197 @@ TRANSITION_MAP = {
     "Bug": SIMPLE_TRANSITIONS
 }
 
+# Jira key in parentheses at the end of a linked issue title, e.g. "Fix crash (ABC-123)"
+_LINKED_JIRA_KEY_RE = re.compile(r'\(([A-Z]{3,4}-\d+)\)')
+# Any Jira key and any parentheses left empty once keys are stripped from a PR title
+_JIRA_KEY_RE = re.compile(r'[A-Z]{3,4}-\d+')
+_EMPTY_PARENS_RE = re.compile(r'\(\s*\)')
+
 class ApprovalStatus(Enum):
     APPROVED = 1
     CHANGES_REQUESTED = 2
     REVIEW_IN_PROGRESS = 3
 
+def __build_transition_actions():
+    """
+    Flattens TRANSITION_MAP into (issue type, Jira status, PR approval status) -> (transition, log, comment)
+    """
+    actions = {}
+    for issue_type, transitions in TRANSITION_MAP.items():
+        actions[(issue_type, transitions["approved_status"], ApprovalStatus.REVIEW_IN_PROGRESS)] = (
+            transitions["review"],
+            "Transition from Approved to Review",
+            "The PR linked to this issue has new changes or dismissed reviews and moved back to review.",
+        )
+        actions[(issue_type, transitions["review_status"], ApprovalStatus.APPROVED)] = (
+            transitions["approved"],
+            "Transition from Review to Approved",
+            "The PR linked to this issue has met approval criteria and is ready to merge.",
+        )
+        for status in (transitions["review_status"], transitions["approved_status"]):
+            actions[(issue_type, status, ApprovalStatus.CHANGES_REQUESTED)] = (
+                transitions["progress"],
+                "Transition back to in progress",
+                "The PR linked to this issue has new changes requested and moved back in progress.",
+            )
+    return actions
+
+TRANSITION_ACTIONS = __build_transition_actions()
+
 def sync_remain_prs(jira):
     """
     Sync remain PRs (i.e. PRs without any comments) to Jira
     """
-    github = Github(os.environ['GITHUB_TOKEN'])
-    repo = github.get_repo(os.environ['GITHUB_REPOSITORY'])
-    prs = repo.get_pulls(state='open', sort='created', direction='desc')
-    for pr in prs:
-        if not repo.has_in_collaborators(pr.user.login):
-            # mock a github issue using current PR
-            gh_issue = {
-                'pull_request': True,
-                'labels': [{'name': lbl.name} for lbl in pr.labels],
-                'number': pr.number,
-                'title': pr.title,
-                'html_url': pr.html_url,
-                'user': {'login': pr.user.login},
-                'state': pr.state,
-                'body': pr.body,
-            }
-            issue = _find_jira_issue(jira, gh_issue)
-            if issue is None:
-                _create_jira_issue(jira, gh_issue)
-
-
-def find_and_link_pr_issues(gh_issue):
+    token = os.environ['GITHUB_TOKEN']
+    owner, repo = get_owner_and_repo()
+    gh_repo = {'name': repo}
+    pr_nodes = []
+    cursor = None
+    while True:
+        prs = list_open_prs_with_author_association(token, owner, repo, after=cursor)
+        for pr in prs.get('nodes'):
+            # Skip known collaborators using the association returned with the PR. Other associations
+            # (e.g. members with private org membership show as CONTRIBUTOR) are confirmed per author.
+            if pr.get('authorAssociation') in COLLABORATOR_ASSOCIATIONS:
+                continue
+            author = pr.get('author')
+            if author and is_collaborator(author.get('login')):
+                continue
+            pr_nodes.append(pr)
+        page_info = prs.get('pageInfo')
+        if not page_info.get('hasNextPage'):
+            break
+        cursor = page_info.get('endCursor')
+    # Look up every PR in Jira concurrently, then create only the missing issues
+    with ThreadPoolExecutor(max_workers=JIRA_LOOKUP_WORKERS) as executor:
+        issues = list(executor.map(lambda pr: _find_pr_jira_issue(jira, pr, gh_repo), pr_nodes))
+    # Creating an issue also edits the PR title through PyGithub, which is not thread-safe
+    # and spaces out its write requests, so creation stays sequential.
+    for pr, issue in zip(pr_nodes, issues):
+        if issue is None:
+            _create_jira_issue(jira, pr_node_to_issue(pr), gh_repo)
+
+
+def _find_pr_jira_issue(jira, pr, gh_repo):
+    """
+    Find the Jira issue synced from the open PR node, if any
+    """
+    # Looking up the Jira issue only needs the PR identity, so the full mock is built only when creating
+    gh_issue = {
+        'pull_request': True,
+        'number': pr.get('number'),
+        'title': pr.get('title'),
+        'html_url': pr.get('url'),
+    }
+    return _find_jira_issue(jira, gh_issue, gh_repo)
+
+
+def find_and_link_pr_issues(gh_issue, pr_details=None):
     """
     Finds any linked issues that will be closed by a PR then adds the Jira issues to the title
     This allows auto linking of PR's to related Jira issues.
+
+    pr_details is an optional result of get_pr_full(), used to avoid querying the closing issues again.
     """
     token = os.environ['GITHUB_TOKEN']
-    github = Github(os.environ['GITHUB_TOKEN'])
-    repo = github.get_repo(os.environ['GITHUB_REPOSITORY'])
+    owner, repo = get_owner_and_repo()
     pr_number = int(gh_issue['number'])
     pr_title = gh_issue['title']
-    closing_issues = find_closing_issues(token, repo.owner.login, repo.name, pr_number)
+    if pr_details is not None:
+        closing_issues = pr_details.closing_issues
+    else:
+        closing_issues = find_closing_issues(token, owner, repo, pr_number)
     closing_numbers = [i.get('number') for i in closing_issues]
     print(f"Closing Issues: {closing_numbers}")
     jira_keys = []
     for issue in closing_issues:
         title = issue.get('title')
-        match = re.search(r'.*\(([A-Z]{3,4}-\d+)\).*', title)
-        if match:
-            jira_key = match.group(1)
+        # Use the last key in the title, as the original greedy pattern did
+        matches = _LINKED_JIRA_KEY_RE.findall(title)
+        if matches:
+            jira_key = matches[-1]
             print(f"Found linked issue: {jira_key}")
             jira_keys.append(jira_key)
     if len(jira_keys) > 0:
-        new_pr_title = re.sub(r'[A-Z]{3,4}-\d+', '', pr_title)
-        new_pr_title = re.sub(r'\(\s*\)', '', new_pr_title).strip()
+        new_pr_title = _JIRA_KEY_RE.sub('', pr_title)
+        new_pr_title = _EMPTY_PARENS_RE.sub('', new_pr_title).strip()
         new_pr_title = f'{new_pr_title} ({" ".join(jira_keys)})'
         print(f'New PR title: {redact(new_pr_title)}')
-        repo.get_issue(pr_number).edit(title=new_pr_title)
+        update_issue_title(token, owner, repo, pr_number, new_pr_title)
     return jira_keys
 
-def check_pr_approval_and_move(jira: JIRA, gh_issue, jira_keys):
+def check_pr_approval_and_move(jira: JIRA, gh_issue, jira_keys, review_status=None):
     """
     Checks the approval criteria of the PR and moves any linked Jira issues to Approved or back to review.
+
+    review_status is an optional, already fetched PR review status (e.g. from get_pr_full()).
     """
-    token = os.environ['GITHUB_TOKEN']
-    github = Github(os.environ['GITHUB_TOKEN'])
-    repo = github.get_repo(os.environ['GITHUB_REPOSITORY'])
-    pr_number = int(gh_issue['number'])
-    pr_status = __check_pr_approval_status(pr_number, repo, token)
-    for key in jira_keys:
-        issue = jira.issue(key)
-        issue_status = str(issue.get_field("status"))
-        issue_type = str(issue.get_field("issuetype"))
-        print(f"{key}: status '{issue_status}' approved '{pr_status}'")
-        transitions = TRANSITION_MAP[issue_type]
-        if pr_status is ApprovalStatus.REVIEW_IN_PROGRESS and issue_status == transitions["approved_status"]:
-            print(f"{key}: Transition from Approved to Review")
-            jira.transition_issue(key, transitions["review"])
-            jira.add_comment(key, "The PR linked to this issue has new changes or dismissed reviews and moved back to review.")
-        elif pr_status is ApprovalStatus.REVIEW_IN_PROGRESS:
-            print(f"PR review is in progress. Skipping...")
-        elif pr_status is ApprovalStatus.APPROVED and issue_status == transitions["review_status"]:
-            print(f"{key}: Transition from Review to Approved")
-            jira.transition_issue(key, transitions["approved"])
-            jira.add_comment(key, "The PR linked to this issue has met approval criteria and is ready to merge.")
-        elif pr_status is ApprovalStatus.CHANGES_REQUESTED and issue_status in [transitions["review_status"], transitions["approved_status"]]:
-            print(f"{key}: Transition back to in progress")
-            jira.transition_issue(key, transitions["progress"])
-            jira.add_comment(key, "The PR linked to this issue has new changes requested and moved back in progress.")
-
-def __check_pr_approval_status(pr, repo, token):
+    if review_status is None:
+        token = os.environ['GITHUB_TOKEN']
+        owner, repo = get_owner_and_repo()
+        pr_number = int(gh_issue['number'])
+        review_status = get_pr_review_status(token, owner, repo, pr_number)
+    pr_status = __check_pr_approval_status(review_status)
+    # Fetch the status and type of all linked issues in a single search instead of one request per key
+    try:
+        issues = jira.enhanced_search_issues(
+            f'key in ({",".join(jira_keys)})', fields='status,issuetype', maxResults=len(jira_keys)
+        )
+    except JIRAError as error:
+        # Jira rejects the whole search if any key does not exist or cannot be browsed
+        print(f'Could not search linked Jira issues, fetching them one by one: {error}')
+        issues = []
+    issues_by_key = {issue.key: issue for issue in issues or []}
+    # Each linked Jira issue is transitioned independently
+    with ThreadPoolExecutor(max_workers=JIRA_TRANSITION_WORKERS) as executor:
+        list(executor.map(lambda key: _move_jira_issue(jira, key, issues_by_key.get(key), pr_status), jira_keys))
+
+
+def _move_jira_issue(jira: JIRA, key, issue, pr_status):
     """
-    Checks the approval criteria of the PR
+    Moves a single linked Jira issue according to the PR approval status.
+
+    issue is None when the batch search did not return the key, e.g. the issue has moved
+    and is returned under its new key, so it is fetched directly to follow the move.
+    """
+    if issue is None:
+        try:
+            issue = jira.issue(key, fields='status,issuetype')
+        except JIRAError as error:
+            print(f"{key}: Jira issue not found ({error}). Skipping...")
+            return
+    issue_status = str(issue.fields.status)
+    issue_type = str(issue.fields.issuetype)
+    print(f"{key}: status '{issue_status}' approved '{pr_status}'")
+    action = TRANSITION_ACTIONS.get((issue_type, issue_status, pr_status))
+    if action is not None:
+        transition, message, comment = action
+        print(f"{key}: {message}")
+        jira.transition_issue(key, transition)
+        jira.add_comment(key, comment)
+    elif pr_status is ApprovalStatus.REVIEW_IN_PROGRESS:
+        print(f"PR review is in progress. Skipping...")
+
+def __check_pr_approval_status(status):
     """
-    status = get_pr_review_status(token, repo.owner.login, repo.name, pr)
+    Checks the approval criteria of the PR from its review status
+    """
+    changes_requested = False
+    num_approved = 0
+    for review in status.reviews:
+        if review == "CHANGES_REQUESTED":
+            changes_requested = True
+        elif review == "APPROVED":
+            num_approved += 1
     approved = status.outcome == "APPROVED"
-    changes_requested = any([r for r in status.reviews if r == "CHANGES_REQUESTED"])
-    num_approved = len([r for r in status.reviews if r == "APPROVED"])
     print(f"PR Status: {status.outcome} with {num_approved}/{MINIMUM_APPROVALS} approvals")
-    
+
     # Not approved and a reviewer has active requested changes
     if not approved and changes_requested:
         return ApprovalStatus.CHANGES_REQUESTED
     # Approved and meets minimum approvals
     elif approved and num_approved >= MINIMUM_APPROVALS:
         return ApprovalStatus.APPROVED
-    # Review is currently in progress
-    elif not approved and not changes_requested:
+    # Review is currently in progress, or approved without the minimum approvals yet
+    else:
         return ApprovalStatus.REVIEW_IN_PROGRESS
-    
-    
\ No newline at end of file
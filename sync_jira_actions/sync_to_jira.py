@@ -17,11 +17,11 @@
 #
 import json
 import os
-import requests
 
+import orjson
 from logging_utils import is_debug
 
-from github import Github
+from github_utils import get_json, get_owner_and_repo, is_collaborator
 from jira import JIRA
 from sync_issue import handle_comment_created
 from sync_issue import handle_comment_deleted
@@ -36,7 +36,7 @@ from sync_issue import handle_issue_unlabeled
 from sync_issue import sync_issues_manually
 from sync_issue import find_jira_issue
 from sync_pr import sync_remain_prs, find_and_link_pr_issues, check_pr_approval_and_move
-from github_graphql import get_recently_updated_pr_url
+from github_graphql import get_pr_full, get_recently_updated_pr_issue
 
 
 class _JIRA(JIRA):
@@ -79,8 +79,8 @@ def main():
     print(f"On: {event_name}")
 
     # The path of the file with the complete webhook event payload. For example, /github/workflow/event.json.
-    with open(os.environ['GITHUB_EVENT_PATH'], 'r', encoding='utf-8') as file:
-        event = json.load(file)
+    with open(os.environ['GITHUB_EVENT_PATH'], 'rb') as file:
+        event = orjson.loads(file.read())
         if is_debug():
             print(json.dumps(event, indent=4))
 
@@ -110,8 +110,7 @@ def main():
     action = event['action']
 
     token = os.environ['GITHUB_TOKEN']
-    github = Github(token)
-    repo = github.get_repo(os.environ['GITHUB_REPOSITORY'])
+    owner, repo = get_owner_and_repo()
 
     if event_name == 'pull_request':
         # Treat pull request events just like issues events for syncing purposes
@@ -127,7 +126,7 @@ def main():
         event_name = 'issues'
         issue_url = event['pull_request']['_links']['issue']['href']
         print(f'GET {issue_url}')
-        data = requests.get(issue_url).json()
+        data = get_json(token, issue_url)
         if is_debug():
             print(json.dumps(data, indent=4))
         event['issue'] = data
@@ -139,29 +138,35 @@ def main():
         run_event = run_data.get('event')
         if run_event == 'pull_request_review':
             event_name = 'issues'
-            issue_url = get_recently_updated_pr_url(token, repo.owner.login, repo.name)
-            print(f'GET Last Updated PR: {issue_url}')
-            data = requests.get(issue_url).json()
+            data = get_recently_updated_pr_issue(token, owner, repo)
+            if data is None:
+                print('No recently updated Pull Request found. Skipping.')
+                return
+            print(f"Last Updated PR: {data['html_url']}")
             if is_debug():
                 print(json.dumps(data, indent=4))
             event['issue'] = data
 
     sync_label = os.environ.get('INPUT_SYNC_LABEL')
     gh_issue = event['issue']
-    has_sync_label = sync_label in [l['name'] for l in gh_issue["labels"]]
+    has_sync_label = bool(sync_label) and any(label['name'] == sync_label for label in gh_issue['labels'])
 
     # Don't sync a PR if user/creator is a collaborator
     # unless a sync label is used and is present.
     is_pr = 'pull_request' in gh_issue
 
+    # Review status fetched along with the closing issues, reused for a standalone PR
+    pr_details = None
     if is_pr and os.environ.get('INPUT_LINK_CLOSING_ISSUES'):
-        jira_keys = find_and_link_pr_issues(gh_issue)
+        # Fetch closing issues and review status together to save a GraphQL round-trip
+        pr_details = get_pr_full(token, owner, repo, int(gh_issue['number']))
+        jira_keys = find_and_link_pr_issues(gh_issue, pr_details)
         if any(jira_keys):
-            check_pr_approval_and_move(jira, gh_issue, jira_keys)
+            check_pr_approval_and_move(jira, gh_issue, jira_keys, pr_details)
             print("Skipping sync for Pull Request linked to synced GitHub Issue")
             return
 
-    if is_pr and repo.has_in_collaborators(gh_issue['user']['login']) and not has_sync_label:
+    if is_pr and is_collaborator(gh_issue['user']['login']) and not has_sync_label:
         print('Skipping issue sync for Pull Request from collaborator')
         return
 
@@ -175,7 +180,7 @@ def main():
     if is_pr:
         issue = find_jira_issue(jira, gh_issue)
         if issue is not None:
-            check_pr_approval_and_move(jira, gh_issue, [issue.key])
+            check_pr_approval_and_move(jira, gh_issue, [issue.key], pr_details)
 
     action_handlers = {
         'issues': {
@@ -16,18 +16,18 @@ class TestFindClosingIssues:
     def test_success(self):
         nodes = [{'number': 1, 'title': 'Fix bug (PROJ-123)'}]
         data = {'data': {'repository': {'pullRequest': {'closingIssuesReferences': {'nodes': nodes}}}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
             result = github_graphql.find_closing_issues('token', 'owner', 'repo', 1)
         assert result == nodes
 
     def test_query_failure_raises_exception(self):
-        with patch('requests.post', return_value=make_mock_response({}, 400)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response({}, 400)):
             with pytest.raises(Exception, match='Query failed'):
                 github_graphql.find_closing_issues('token', 'owner', 'repo', 1)
 
     def test_empty_nodes(self):
         data = {'data': {'repository': {'pullRequest': {'closingIssuesReferences': {'nodes': []}}}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
             result = github_graphql.find_closing_issues('token', 'owner', 'repo', 99)
         assert result == []
 
@@ -36,12 +36,12 @@ class TestFindClosedByPr:
     def test_success(self):
         nodes = [{'number': 10, 'title': 'Some issue'}]
         data = {'data': {'repository': {'issue': {'closedByPullRequestsReferences': {'nodes': nodes}}}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
             result = github_graphql.find_closed_by_pr('token', 'owner', 'repo', 10)
         assert result == nodes
 
     def test_query_failure_raises_exception(self):
-        with patch('requests.post', return_value=make_mock_response({}, 500)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response({}, 500)):
             with pytest.raises(Exception):
                 github_graphql.find_closed_by_pr('token', 'owner', 'repo', 10)
 
@@ -51,42 +51,127 @@ class TestGetPrReviewStatus:
         reviews = [{'state': 'APPROVED'}, {'state': 'APPROVED'}, {'state': 'APPROVED'}]
         pr_data = {'title': 'Test PR', 'reviewDecision': 'APPROVED', 'latestReviews': {'nodes': reviews}}
         data = {'data': {'repository': {'pullRequest': pr_data}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
             result = github_graphql.get_pr_review_status('token', 'owner', 'repo', 1)
         assert result.title == 'Test PR'
         assert result.outcome == 'APPROVED'
         assert result.reviews == ['APPROVED', 'APPROVED', 'APPROVED']
+        assert isinstance(result, github_graphql.PullRequestReviewStatus)
 
     def test_changes_requested(self):
         reviews = [{'state': 'CHANGES_REQUESTED'}]
         pr_data = {'title': 'Test PR', 'reviewDecision': 'CHANGES_REQUESTED', 'latestReviews': {'nodes': reviews}}
         data = {'data': {'repository': {'pullRequest': pr_data}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
             result = github_graphql.get_pr_review_status('token', 'owner', 'repo', 2)
         assert result.outcome == 'CHANGES_REQUESTED'
         assert 'CHANGES_REQUESTED' in result.reviews
 
     def test_query_failure_raises_exception(self):
-        with patch('requests.post', return_value=make_mock_response({}, 403)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response({}, 403)):
             with pytest.raises(Exception):
                 github_graphql.get_pr_review_status('token', 'owner', 'repo', 1)
 
 
-class TestGetRecentlyUpdatedPrUrl:
+class TestGetPrFull:
     def test_success(self):
-        nodes = [{'title': 'Test PR', 'number': 5, 'updatedAt': '2024-01-01'}]
+        reviews = [{'state': 'APPROVED'}, {'state': 'CHANGES_REQUESTED'}]
+        closing = [{'number': 3, 'title': 'Bug (PROJ-1)'}]
+        pr_data = {
+            'title': 'Test PR',
+            'reviewDecision': 'REVIEW_REQUIRED',
+            'latestReviews': {'nodes': reviews},
+            'closingIssuesReferences': {'nodes': closing},
+        }
+        data = {'data': {'repository': {'pullRequest': pr_data}}}
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)) as mock_post:
+            result = github_graphql.get_pr_full('token', 'owner', 'repo', 1)
+        mock_post.assert_called_once()
+        assert result.title == 'Test PR'
+        assert result.outcome == 'REVIEW_REQUIRED'
+        assert result.reviews == ['APPROVED', 'CHANGES_REQUESTED']
+        assert result.closing_issues == closing
+
+    def test_query_failure_raises_exception(self):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response({}, 502)):
+            with pytest.raises(Exception):
+                github_graphql.get_pr_full('token', 'owner', 'repo', 1)
+
+
+class TestListOpenPrsWithAuthorAssociation:
+    def test_success(self):
+        pull_requests = {
+            'nodes': [{'number': 1, 'authorAssociation': 'CONTRIBUTOR'}],
+            'pageInfo': {'hasNextPage': True, 'endCursor': 'abc'},
+        }
+        data = {'data': {'repository': {'pullRequests': pull_requests}}}
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)) as mock_post:
+            result = github_graphql.list_open_prs_with_author_association('token', 'owner', 'repo', after='xyz')
+        assert result == pull_requests
+        assert mock_post.call_args.kwargs['json']['variables']['after'] == 'xyz'
+
+    def test_query_failure_raises_exception(self):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response({}, 500)):
+            with pytest.raises(Exception):
+                github_graphql.list_open_prs_with_author_association('token', 'owner', 'repo')
+
+
+class TestGetRecentlyUpdatedPrIssue:
+    def test_success(self):
+        nodes = [{
+            'number': 5, 'title': 'Test PR', 'body': 'body', 'url': 'https://github.com/owner/myrepo/pull/5',
+            'state': 'OPEN', 'author': {'login': 'user', 'url': 'https://github.com/user'},
+            'labels': {'nodes': [{'name': 'bug'}]}, 'comments': {'totalCount': 2},
+        }]
         data = {'data': {'repository': {'pullRequests': {'nodes': nodes}}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
-            result = github_graphql.get_recently_updated_pr_url('token', 'owner', 'myrepo')
-        assert result == 'https://api.github.com/repos/owner/myrepo/issues/5'
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
+            result = github_graphql.get_recently_updated_pr_issue('token', 'owner', 'myrepo')
+        assert result == {
+            'pull_request': True,
+            'labels': [{'name': 'bug'}],
+            'number': 5,
+            'title': 'Test PR',
+            'html_url': 'https://github.com/owner/myrepo/pull/5',
+            'user': {'login': 'user', 'html_url': 'https://github.com/user'},
+            'state': 'open',
+            'body': 'body',
+            'comments': 2,
+        }
 
     def test_no_nodes_returns_none(self):
         data = {'data': {'repository': {'pullRequests': {'nodes': None}}}}
-        with patch('requests.post', return_value=make_mock_response(data)):
-            result = github_graphql.get_recently_updated_pr_url('token', 'owner', 'repo')
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)):
+            result = github_graphql.get_recently_updated_pr_issue('token', 'owner', 'repo')
         assert result is None
 
     def test_query_failure_raises_exception(self):
-        with patch('requests.post', return_value=make_mock_response({}, 401)):
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response({}, 401)):
             with pytest.raises(Exception):
-                github_graphql.get_recently_updated_pr_url('token', 'owner', 'repo')
+                github_graphql.get_recently_updated_pr_issue('token', 'owner', 'repo')
+
+
+class TestPrNodeToIssue:
+    def test_deleted_author(self):
+        node = {'number': 1, 'title': 'PR', 'body': None, 'url': 'u', 'state': 'OPEN', 'author': None,
+                'labels': {'nodes': []}}
+        result = github_graphql.pr_node_to_issue(node)
+        assert result['user']['login'] == 'ghost'
+        assert result['comments'] == 0
+
+
+class TestGetSession:
+    def test_sets_authorization_header(self):
+        session = github_graphql.get_session('token-a')
+        assert session is github_graphql._SESSION
+        assert session.headers['Authorization'] == 'Bearer token-a'
+
+    def test_updates_authorization_header_for_new_token(self):
+        github_graphql.get_session('token-a')
+        session = github_graphql.get_session('token-b')
+        assert session.headers['Authorization'] == 'Bearer token-b'
+
+    def test_post_query_uses_session_with_timeout(self):
+        data = {'data': {'repository': {'pullRequest': {'closingIssuesReferences': {'nodes': []}}}}}
+        with patch.object(github_graphql._SESSION, 'post', return_value=make_mock_response(data)) as mock_post:
+            github_graphql.find_closing_issues('token', 'owner', 'repo', 1)
+        assert mock_post.call_args.kwargs['timeout'] == github_graphql.REQUEST_TIMEOUT
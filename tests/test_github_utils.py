@@ -0,0 +1,113 @@
+import importlib
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mock_env_vars(monkeypatch):
+    monkeypatch.setenv('GITHUB_TOKEN', 'fake-token')
+    monkeypatch.setenv('GITHUB_REPOSITORY', 'fake/repo')
+
+
+@pytest.fixture
+def github_utils_module():
+    sys.path.insert(0, 'sync_jira_actions')  # github_utils imports its sibling modules directly
+    with patch('github.Github') as MockGithub:
+        from sync_jira_actions import github_utils
+
+        # Reload to apply the mocked Github client and start with empty caches
+        importlib.reload(github_utils)
+        yield github_utils, MockGithub
+
+
+def test_get_repo_is_fetched_once(github_utils_module):
+    github_utils, MockGithub = github_utils_module
+
+    first = github_utils.get_repo()
+    second = github_utils.get_repo()
+
+    assert first is second
+    MockGithub.assert_called_once_with('fake-token')
+    MockGithub.return_value.get_repo.assert_called_once_with('fake/repo')
+
+
+def test_is_collaborator_cached_per_login(github_utils_module):
+    github_utils, MockGithub = github_utils_module
+    mock_repo = MockGithub.return_value.get_repo.return_value
+    mock_repo.has_in_collaborators.side_effect = lambda login: login == 'member'
+
+    assert github_utils.is_collaborator('member') is True
+    assert github_utils.is_collaborator('member') is True
+    assert github_utils.is_collaborator('external') is False
+
+    assert mock_repo.has_in_collaborators.call_count == 2
+
+
+def test_get_owner_and_repo_from_env(github_utils_module):
+    github_utils, MockGithub = github_utils_module
+
+    assert github_utils.get_owner_and_repo() == ('fake', 'repo')
+    MockGithub.assert_not_called()
+
+
+def test_sync_issue_shares_cached_repo(github_utils_module):
+    _, MockGithub = github_utils_module
+    import github_utils
+    from sync_jira_actions import sync_issue
+
+    MockGithub.reset_mock()
+    importlib.reload(github_utils)
+    importlib.reload(sync_issue)
+
+    assert sync_issue.REPO is github_utils.get_repo()
+    assert sync_issue.GITHUB is github_utils.get_github()
+    MockGithub.return_value.get_repo.assert_called_once_with('fake/repo')
+
+
+def _make_response(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = b'{"number": 1, "title": "Issue"}' if body is None else body
+    return response
+
+
+def test_get_json(github_utils_module):
+    github_utils, _ = github_utils_module
+    url = 'https://api.github.com/repos/owner/repo/issues/1'
+    session = github_utils.get_session('token')
+
+    with patch.object(session, 'get', return_value=_make_response(200)) as mock_get:
+        assert github_utils.get_json('token', url) == {'number': 1, 'title': 'Issue'}
+    mock_get.assert_called_once_with(url, timeout=github_utils.REQUEST_TIMEOUT)
+
+
+def test_get_json_failure_raises_exception(github_utils_module):
+    github_utils, _ = github_utils_module
+    session = github_utils.get_session('token')
+
+    with patch.object(session, 'get', return_value=_make_response(404, b'{}')):
+        with pytest.raises(Exception, match='failed by returning code of 404'):
+            github_utils.get_json('token', 'https://api.github.com/repos/owner/repo/issues/1')
+
+
+def test_update_issue_title(github_utils_module):
+    github_utils, _ = github_utils_module
+    session = github_utils.get_session('token')
+
+    with patch.object(session, 'patch', return_value=_make_response(200)) as mock_patch:
+        github_utils.update_issue_title('token', 'owner', 'repo', 5, 'New title')
+    mock_patch.assert_called_once_with(
+        'https://api.github.com/repos/owner/repo/issues/5', json={'title': 'New title'},
+        timeout=github_utils.REQUEST_TIMEOUT,
+    )
+
+
+def test_update_issue_title_failure_raises_exception(github_utils_module):
+    github_utils, _ = github_utils_module
+    session = github_utils.get_session('token')
+
+    with patch.object(session, 'patch', return_value=_make_response(403)):
+        with pytest.raises(Exception, match='Failed to update title'):
+            github_utils.update_issue_title('token', 'owner', 'repo', 5, 'New title')
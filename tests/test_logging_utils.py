@@ -1,10 +1,17 @@
+import pytest
+
 from sync_jira_actions.logging_utils import is_debug, redact
 
 
 # ── is_debug ──────────────────────────────────────────────────────────────────
 
-def test_is_debug_off_by_default(monkeypatch):
+@pytest.fixture(autouse=True)
+def clear_debug_env(monkeypatch):
     monkeypatch.delenv('ACTIONS_RUNNER_DEBUG', raising=False)
+    monkeypatch.delenv('RUNNER_DEBUG', raising=False)
+
+
+def test_is_debug_off_by_default(monkeypatch):
     assert is_debug() is False
 
 
@@ -13,7 +20,14 @@ def test_is_debug_on_when_env_set(monkeypatch):
     assert is_debug() is True
 
 
+def test_is_debug_on_when_runner_debug_set(monkeypatch):
+    monkeypatch.setenv('RUNNER_DEBUG', '1')
+    assert is_debug() is True
+
+
 def test_is_debug_off_for_other_values(monkeypatch):
+    monkeypatch.setenv('RUNNER_DEBUG', 'true')
+    assert is_debug() is False
     monkeypatch.setenv('ACTIONS_RUNNER_DEBUG', '1')
     assert is_debug() is False
     monkeypatch.setenv('ACTIONS_RUNNER_DEBUG', 'True')
@@ -35,8 +35,10 @@ def sync_issue_module(github_client_mock):
     import sys
     from importlib import reload
     sys.path.insert(0, 'sync_jira_actions')  # Ensure bare-name modules (e.g. logging_utils) are importable on reload
+    import github_utils
     from sync_jira_actions import sync_issue
 
+    reload(github_utils)  # Reset the cached repo so the mocked Github client is used
     reload(sync_issue)  # Reload to apply the mocked Github client
     return sync_issue
 
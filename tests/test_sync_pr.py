@@ -1,8 +1,10 @@
 import importlib
+import threading
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from jira import JIRAError
 
 
 # Patch the GitHub client before importing modules that use it
@@ -16,30 +18,50 @@ def mock_env_vars(monkeypatch):
 def mock_github():
     with patch('github.Github') as MockGithub:
         mock_repo = MagicMock()
-        mock_pr = MagicMock()
-        mock_pr.number = 1
-        mock_pr.title = 'Test PR'
-        mock_pr.html_url = 'http://example.com/testpr'
-        mock_pr.user.login = 'testuser'
-        mock_pr.labels = []
-        mock_pr.state = 'open'
-        mock_pr.body = 'Test body'
-        mock_repo.get_pulls.return_value = [mock_pr]
+        mock_repo.name = 'repo'
+        mock_repo.owner.login = 'fake'
         mock_repo.has_in_collaborators.return_value = False
 
         MockGithub.return_value.get_repo.return_value = mock_repo
         yield mock_repo
 
 
+def _make_pr_node(number, title, association='CONTRIBUTOR', labels=(), login='testuser'):
+    return {
+        'number': number,
+        'title': title,
+        'body': 'Test body',
+        'url': f'http://example.com/pull/{number}',
+        'state': 'OPEN',
+        'authorAssociation': association,
+        'author': {'login': login, 'url': f'https://github.com/{login}'},
+        'labels': {'nodes': [{'name': name} for name in labels]},
+    }
+
+
+@pytest.fixture
+def mock_open_prs():
+    pages = [
+        {
+            'nodes': [_make_pr_node(1, 'Test PR', labels=['bug'])],
+            'pageInfo': {'hasNextPage': False, 'endCursor': None},
+        }
+    ]
+    with patch('sync_pr.list_open_prs_with_author_association', side_effect=pages) as mock_list:
+        yield mock_list
+
+
 @pytest.fixture
 def sync_pr_module(mock_github):
     # Import the module from the sync_jira_actions directory
     import sys
 
     sys.path.insert(0, 'sync_jira_actions')  # Add sync_jira_actions directory to the Python path
+    import github_utils
     import sync_pr
 
-    # Reload the module to ensure the mock is applied
+    # Reload the modules to ensure the mock is applied and the cached repo is reset
+    importlib.reload(github_utils)
     importlib.reload(sync_pr)
     # Return the reloaded module
     return sync_pr
@@ -54,7 +76,7 @@ def mock_sync_issue():
         yield mock_create_jira_issue, mock_find_jira_issue
 
 
-def test_sync_remain_prs(sync_pr_module, mock_sync_issue, mock_github):
+def test_sync_remain_prs(sync_pr_module, mock_sync_issue, mock_github, mock_open_prs):
     mock_jira = MagicMock()
     mock_create_jira_issue, mock_find_jira_issue = mock_sync_issue
 
@@ -63,6 +85,9 @@ def test_sync_remain_prs(sync_pr_module, mock_sync_issue, mock_github):
 
     # Verify _find_jira_issue was called once with the mock_jira client and the PR data
     assert mock_find_jira_issue.call_count == 1
+    find_gh_issue = mock_find_jira_issue.call_args[0][1]
+    assert find_gh_issue['html_url'] == 'http://example.com/pull/1'
+    assert 'labels' not in find_gh_issue
 
     # Verify _create_jira_issue was called once since no corresponding JIRA issue was found
     assert mock_create_jira_issue.call_count == 1
@@ -70,6 +95,91 @@ def test_sync_remain_prs(sync_pr_module, mock_sync_issue, mock_github):
     # Example of verifying call arguments (simplified)
     call_args = mock_create_jira_issue.call_args
     assert 'Test PR' in call_args[0][1]['title'], 'PR title does not match expected value'
+    assert call_args[0][1]['state'] == 'open'
+    assert call_args[0][1]['labels'] == [{'name': 'bug'}]
+    assert call_args[0][2] == {'name': 'repo'}
+
+
+def test_sync_remain_prs_existing_issue_not_created(sync_pr_module, mock_github, mock_open_prs):
+    mock_jira = MagicMock()
+    with (
+        patch('sync_pr._find_jira_issue', return_value=MagicMock()),
+        patch('sync_pr._create_jira_issue') as mock_create_jira_issue,
+        patch('sync_pr.pr_node_to_issue') as mock_pr_issue,
+    ):
+        sync_pr_module.sync_remain_prs(mock_jira)
+
+    mock_create_jira_issue.assert_not_called()
+    mock_pr_issue.assert_not_called()
+
+
+def test_sync_remain_prs_creates_only_missing(sync_pr_module, mock_github):
+    """Missing issues are created in PR order on the calling thread."""
+    mock_jira = MagicMock()
+    pages = [
+        {
+            'nodes': [_make_pr_node(n, f'PR {n}') for n in (1, 2, 3)],
+            'pageInfo': {'hasNextPage': False, 'endCursor': None},
+        }
+    ]
+    existing = {'http://example.com/pull/2': MagicMock()}
+    creating_threads = []
+    with (
+        patch('sync_pr.list_open_prs_with_author_association', side_effect=pages),
+        patch('sync_pr._find_jira_issue', side_effect=lambda j, gh_issue, r: existing.get(gh_issue['html_url'])),
+        patch('sync_pr._create_jira_issue') as mock_create_jira_issue,
+    ):
+        mock_create_jira_issue.side_effect = lambda *args: creating_threads.append(threading.get_ident())
+        sync_pr_module.sync_remain_prs(mock_jira)
+
+    assert creating_threads == [threading.get_ident()] * 2
+    assert [c.args[1]['number'] for c in mock_create_jira_issue.call_args_list] == [1, 3]
+
+
+def test_sync_remain_prs_pages_and_skips_collaborators(sync_pr_module, mock_sync_issue, mock_github):
+    mock_jira = MagicMock()
+    mock_create_jira_issue, mock_find_jira_issue = mock_sync_issue
+    pages = [
+        {
+            'nodes': [_make_pr_node(3, 'Member PR', 'MEMBER'), _make_pr_node(2, 'External PR')],
+            'pageInfo': {'hasNextPage': True, 'endCursor': 'cursor-1'},
+        },
+        {
+            'nodes': [_make_pr_node(1, 'Owner PR', 'OWNER')],
+            'pageInfo': {'hasNextPage': False, 'endCursor': 'cursor-2'},
+        },
+    ]
+    with patch('sync_pr.list_open_prs_with_author_association', side_effect=pages) as mock_list:
+        sync_pr_module.sync_remain_prs(mock_jira)
+
+    assert mock_list.call_count == 2
+    assert mock_list.call_args.kwargs['after'] == 'cursor-1'
+    assert [c.args[1]['number'] for c in mock_find_jira_issue.call_args_list] == [2]
+    mock_github.has_in_collaborators.assert_called_once_with('testuser')
+    assert [c.args[1]['number'] for c in mock_create_jira_issue.call_args_list] == [2]
+
+
+def test_sync_remain_prs_skips_contributor_collaborator(sync_pr_module, mock_sync_issue, mock_github):
+    """A CONTRIBUTOR author may still be a collaborator, e.g. with private org membership."""
+    mock_jira = MagicMock()
+    mock_create_jira_issue, mock_find_jira_issue = mock_sync_issue
+    mock_github.has_in_collaborators.side_effect = lambda login: login == 'private-member'
+    pages = [
+        {
+            'nodes': [
+                _make_pr_node(1, 'Private member PR', login='private-member'),
+                _make_pr_node(2, 'External PR', login='external'),
+                _make_pr_node(3, 'Another private member PR', login='private-member'),
+            ],
+            'pageInfo': {'hasNextPage': False, 'endCursor': None},
+        }
+    ]
+    with patch('sync_pr.list_open_prs_with_author_association', side_effect=pages):
+        sync_pr_module.sync_remain_prs(mock_jira)
+
+    assert [c.args[1]['number'] for c in mock_create_jira_issue.call_args_list] == [2]
+    # The collaborator check is cached per login
+    assert mock_github.has_in_collaborators.call_count == 2
 
 
 # ── find_and_link_pr_issues ───────────────────────────────────────────────────
@@ -96,12 +206,56 @@ def test_find_and_link_pr_issues_with_jira_keys(sync_pr_module, mock_github):
 
     with (
         patch('sync_pr.find_closing_issues', return_value=closing_issues),
-        patch('sync_pr.Github', return_value=MagicMock(get_repo=MagicMock(return_value=mock_github))),
+        patch('sync_pr.update_issue_title') as mock_update_title,
     ):
         result = sync_pr_module.find_and_link_pr_issues(gh_issue)
 
     assert 'PROJ-42' in result
-    mock_github.get_issue.assert_called_once_with(5)
+    mock_update_title.assert_called_once_with('fake-token', 'fake', 'repo', 5, 'Fix the bug (PROJ-42)')
+    mock_github.get_issue.assert_not_called()
+
+
+def test_find_and_link_pr_issues_replaces_existing_keys(sync_pr_module, mock_github):
+    gh_issue = {
+        'number': 9,
+        'title': 'Fix the bug (OLD-1)',
+        'html_url': 'https://github.com/fake/repo/pull/9',
+        'user': {'login': 'testuser'},
+        'labels': [],
+    }
+    closing_issues = [
+        {'title': 'First (PROJ-1) then (PROJ-2)', 'number': 13},
+        {'title': 'Dangling PROJ- reference (PROJ-)', 'number': 14},
+    ]
+
+    with (
+        patch('sync_pr.find_closing_issues', return_value=closing_issues),
+        patch('sync_pr.update_issue_title') as mock_update_title,
+    ):
+        result = sync_pr_module.find_and_link_pr_issues(gh_issue)
+
+    assert result == ['PROJ-2']
+    assert mock_update_title.call_args[0][4] == 'Fix the bug (PROJ-2)'
+
+
+def test_find_and_link_pr_issues_uses_prefetched_details(sync_pr_module, mock_github):
+    gh_issue = {
+        'number': 8,
+        'title': 'Fix the bug',
+        'html_url': 'https://github.com/fake/repo/pull/8',
+        'user': {'login': 'testuser'},
+        'labels': [],
+    }
+    pr_details = _make_pr_review_status(None, [], closing_issues=[{'title': 'Related (PROJ-7)', 'number': 12}])
+
+    with (
+        patch('sync_pr.find_closing_issues') as mock_find_closing,
+        patch('sync_pr.update_issue_title'),
+    ):
+        result = sync_pr_module.find_and_link_pr_issues(gh_issue, pr_details)
+
+    assert result == ['PROJ-7']
+    mock_find_closing.assert_not_called()
 
 
 def test_find_and_link_pr_issues_no_closing_issues(sync_pr_module, mock_github):
@@ -135,17 +289,23 @@ def test_find_and_link_pr_issues_no_jira_key_in_title(sync_pr_module, mock_githu
 
 # ── check_pr_approval_and_move ────────────────────────────────────────────────
 
-def _make_pr_review_status(outcome, reviews):
+def _make_pr_review_status(outcome, reviews, closing_issues=None):
     from collections import namedtuple
-    data = {'title': 'Test PR', 'outcome': outcome, 'reviews': reviews}
+    data = {'title': 'Test PR', 'outcome': outcome, 'reviews': reviews, 'closing_issues': closing_issues or []}
     return namedtuple('Struct', data.keys())(*data.values())
 
 
+def _make_jira_issue(key, status, issue_type='Task'):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.status = status
+    issue.fields.issuetype = issue_type
+    return issue
+
+
 def test_check_pr_approval_and_move_approved(sync_pr_module, mock_github):
     mock_jira = MagicMock()
-    mock_issue = MagicMock()
-    mock_issue.get_field.side_effect = lambda f: 'Review in progress' if f == 'status' else 'Task'
-    mock_jira.issue.return_value = mock_issue
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-1', 'Review in progress')]
 
     gh_issue = {'number': 1, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
     jira_keys = ['PROJ-1']
@@ -160,9 +320,7 @@ def test_check_pr_approval_and_move_approved(sync_pr_module, mock_github):
 
 def test_check_pr_approval_and_move_changes_requested(sync_pr_module, mock_github):
     mock_jira = MagicMock()
-    mock_issue = MagicMock()
-    mock_issue.get_field.side_effect = lambda f: 'Review in progress' if f == 'status' else 'Task'
-    mock_jira.issue.return_value = mock_issue
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-2', 'Review in progress')]
 
     gh_issue = {'number': 2, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
     jira_keys = ['PROJ-2']
@@ -176,9 +334,7 @@ def test_check_pr_approval_and_move_changes_requested(sync_pr_module, mock_githu
 
 def test_check_pr_approval_and_move_review_in_progress(sync_pr_module, mock_github):
     mock_jira = MagicMock()
-    mock_issue = MagicMock()
-    mock_issue.get_field.side_effect = lambda f: 'In Progress' if f == 'status' else 'Task'
-    mock_jira.issue.return_value = mock_issue
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-3', 'In Progress')]
 
     gh_issue = {'number': 3, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
     jira_keys = ['PROJ-3']
@@ -193,9 +349,7 @@ def test_check_pr_approval_and_move_review_in_progress(sync_pr_module, mock_gith
 def test_check_pr_approval_and_move_approved_demotes_to_review(sync_pr_module, mock_github):
     """When review is in progress but jira issue was previously approved, demote it."""
     mock_jira = MagicMock()
-    mock_issue = MagicMock()
-    mock_issue.get_field.side_effect = lambda f: 'Reviewer Approved' if f == 'status' else 'Task'
-    mock_jira.issue.return_value = mock_issue
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-4', 'Reviewer Approved')]
 
     gh_issue = {'number': 4, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
     jira_keys = ['PROJ-4']
@@ -206,3 +360,123 @@ def test_check_pr_approval_and_move_approved_demotes_to_review(sync_pr_module, m
 
     mock_jira.transition_issue.assert_called_once()
     mock_jira.add_comment.assert_called_once()
+
+
+def test_check_pr_approval_and_move_uses_prefetched_status(sync_pr_module, mock_github):
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-5', 'Review in progress')]
+
+    gh_issue = {'number': 5, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    status = _make_pr_review_status('APPROVED', ['APPROVED', 'APPROVED', 'APPROVED'])
+    with patch('sync_pr.get_pr_review_status') as mock_get_status:
+        sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, ['PROJ-5'], status)
+
+    mock_get_status.assert_not_called()
+    mock_jira.transition_issue.assert_called_once_with('PROJ-5', 'Reviewer Approved')
+
+
+def test_check_pr_approval_and_move_multiple_keys(sync_pr_module, mock_github):
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.return_value = [
+        _make_jira_issue(key, 'Review in progress') for key in ('PROJ-6', 'PROJ-7', 'PROJ-8')
+    ]
+
+    gh_issue = {'number': 6, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    jira_keys = ['PROJ-6', 'PROJ-7', 'PROJ-8']
+    status = _make_pr_review_status('APPROVED', ['APPROVED', 'APPROVED', 'APPROVED'])
+    sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, jira_keys, status)
+
+    mock_jira.enhanced_search_issues.assert_called_once_with(
+        'key in (PROJ-6,PROJ-7,PROJ-8)', fields='status,issuetype', maxResults=3
+    )
+    mock_jira.issue.assert_not_called()
+    transitioned = sorted(c.args[0] for c in mock_jira.transition_issue.call_args_list)
+    assert transitioned == jira_keys
+    assert mock_jira.add_comment.call_count == 3
+
+
+def test_check_pr_approval_and_move_missing_issue_skipped(sync_pr_module, mock_github, capsys):
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.return_value = []
+    mock_jira.issue.side_effect = JIRAError(status_code=404, text='Issue Does Not Exist')
+
+    gh_issue = {'number': 7, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    status = _make_pr_review_status('APPROVED', ['APPROVED', 'APPROVED', 'APPROVED'])
+    sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, ['PROJ-9'], status)
+
+    mock_jira.transition_issue.assert_not_called()
+    assert 'PROJ-9: Jira issue not found' in capsys.readouterr().out
+
+
+def test_check_pr_approval_and_move_moved_issue_fetched_by_key(sync_pr_module, mock_github):
+    """A moved issue is returned by the search under its new key, so the old key is fetched directly."""
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('NEW-1', 'Review in progress')]
+    mock_jira.issue.return_value = _make_jira_issue('NEW-1', 'Review in progress')
+
+    gh_issue = {'number': 8, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    status = _make_pr_review_status('APPROVED', ['APPROVED', 'APPROVED', 'APPROVED'])
+    sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, ['OLD-1'], status)
+
+    mock_jira.issue.assert_called_once_with('OLD-1', fields='status,issuetype')
+    mock_jira.transition_issue.assert_called_once_with('OLD-1', 'Reviewer Approved')
+
+
+def test_check_pr_approval_and_move_search_error_falls_back(sync_pr_module, mock_github):
+    """A rejected search (e.g. one key does not exist) does not block the other keys."""
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.side_effect = JIRAError(status_code=400, text='An issue key is invalid')
+    issues = {'PROJ-12': _make_jira_issue('PROJ-12', 'Review in progress')}
+
+    def fetch_issue(key, fields=None):
+        if key not in issues:
+            raise JIRAError(status_code=404, text='Issue Does Not Exist')
+        return issues[key]
+
+    mock_jira.issue.side_effect = fetch_issue
+
+    gh_issue = {'number': 12, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    status = _make_pr_review_status('APPROVED', ['APPROVED', 'APPROVED', 'APPROVED'])
+    sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, ['BAD-1', 'PROJ-12'], status)
+
+    assert mock_jira.issue.call_count == 2
+    mock_jira.transition_issue.assert_called_once_with('PROJ-12', 'Reviewer Approved')
+
+
+def test_check_pr_approval_and_move_approved_below_minimum_demotes(sync_pr_module, mock_github):
+    """An approved PR without the minimum approvals is still in review."""
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-10', 'Reviewer Approved')]
+
+    gh_issue = {'number': 10, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    status = _make_pr_review_status('APPROVED', ['APPROVED'])
+    sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, ['PROJ-10'], status)
+
+    mock_jira.transition_issue.assert_called_once_with('PROJ-10', 'Review in progress')
+
+
+@pytest.mark.parametrize(
+    'issue_type, issue_status, outcome, reviews, expected',
+    [
+        ('GitHub Issue', 'Review in progress', 'APPROVED', ['APPROVED'] * 3, 'Approved'),
+        ('GitHub Issue', 'Reviewer Approved', None, [], 'Requires re-review'),
+        ('GitHub Issue', 'Reviewer Approved', 'CHANGES_REQUESTED', ['CHANGES_REQUESTED'], 'Changes Requested'),
+        ('Bug', 'Reviewer Approved', 'CHANGES_REQUESTED', ['CHANGES_REQUESTED'], 'In Progress'),
+        ('Story', 'In Progress', 'APPROVED', ['APPROVED'] * 3, None),
+        ('Epic', 'Review in progress', 'APPROVED', ['APPROVED'] * 3, None),
+    ],
+)
+def test_check_pr_approval_and_move_transitions(
+    sync_pr_module, mock_github, issue_type, issue_status, outcome, reviews, expected
+):
+    mock_jira = MagicMock()
+    mock_jira.enhanced_search_issues.return_value = [_make_jira_issue('PROJ-11', issue_status, issue_type)]
+
+    gh_issue = {'number': 11, 'title': 'Test', 'user': {'login': 'u'}, 'labels': []}
+    status = _make_pr_review_status(outcome, reviews)
+    sync_pr_module.check_pr_approval_and_move(mock_jira, gh_issue, ['PROJ-11'], status)
+
+    if expected is None:
+        mock_jira.transition_issue.assert_not_called()
+    else:
+        mock_jira.transition_issue.assert_called_once_with('PROJ-11', expected)
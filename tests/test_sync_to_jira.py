@@ -157,9 +157,8 @@ def test_pull_request_event(mock_environment, mock_jira_client, sync_to_jira_mai
     with (
         patch('sync_jira_actions.sync_to_jira.handle_issue_opened'),
         patch('sync_jira_actions.sync_to_jira.find_jira_issue', return_value=None),
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
     ):
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
 
 
@@ -183,14 +182,14 @@ def test_pull_request_target_event(mock_environment, mock_jira_client, sync_to_j
     monkeypatch.setenv('GITHUB_EVENT_NAME', 'pull_request_target')
 
     with (
-        patch('requests.get') as mock_get,
-        patch('sync_jira_actions.sync_to_jira.handle_issue_opened'),
+        patch('sync_jira_actions.sync_to_jira.get_json', return_value=issue_data) as mock_get_json,
+        patch('sync_jira_actions.sync_to_jira.handle_issue_opened') as mock_handler,
         patch('sync_jira_actions.sync_to_jira.find_jira_issue', return_value=None),
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
     ):
-        mock_get.return_value.json.return_value = issue_data
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
+    mock_get_json.assert_called_once_with('fake-token', 'https://api.github.com/repos/espressif/esp-idf/issues/11')
+    assert mock_handler.call_args[0][1]['issue'] == issue_data
 
 
 # ── workflow_run event ────────────────────────────────────────────────────────
@@ -199,7 +198,7 @@ def test_workflow_run_pull_request_review(mock_environment, mock_jira_client, sy
     issue_data = {
         'number': 12, 'title': 'PR', 'body': 'body',
         'user': {'login': 'user'}, 'labels': [],
-        'html_url': 'https://github.com/espressif/esp-idf/issues/12',
+        'html_url': 'https://github.com/espressif/esp-idf/pull/12',
         'state': 'open', 'pull_request': True,
     }
     event_data = {
@@ -210,16 +209,65 @@ def test_workflow_run_pull_request_review(mock_environment, mock_jira_client, sy
     monkeypatch.setenv('GITHUB_EVENT_NAME', 'workflow_run')
 
     with (
-        patch('sync_jira_actions.sync_to_jira.get_recently_updated_pr_url', return_value='https://api.github.com/repos/r/r/issues/12'),
-        patch('requests.get') as mock_get,
-        patch('sync_jira_actions.sync_to_jira.find_jira_issue', return_value=None),
-        patch('sync_jira_actions.sync_to_jira.check_pr_approval_and_move'),
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.get_recently_updated_pr_issue', return_value=issue_data),
+        patch('sync_jira_actions.sync_to_jira.get_json') as mock_get_json,
+        patch('sync_jira_actions.sync_to_jira.find_jira_issue', return_value=MagicMock(key='PROJ-12')),
+        patch('sync_jira_actions.sync_to_jira.check_pr_approval_and_move') as mock_move,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
+    ):
+        sync_to_jira_main()
+    mock_get_json.assert_not_called()
+    mock_move.assert_called_once_with(mock_jira_client, issue_data, ['PROJ-12'], None)
+
+
+def test_workflow_run_no_recent_pr(mock_environment, mock_jira_client, sync_to_jira_main, monkeypatch, capsys):
+    mock_environment.write_text(json.dumps({'action': 'completed', 'workflow_run': {'event': 'pull_request_review'}}))
+    monkeypatch.setenv('GITHUB_EVENT_NAME', 'workflow_run')
+
+    with patch('sync_jira_actions.sync_to_jira.get_recently_updated_pr_issue', return_value=None):
+        sync_to_jira_main()
+    assert 'No recently updated Pull Request found' in capsys.readouterr().out
+
+
+# ── link closing issues ───────────────────────────────────────────────────────
+
+@pytest.mark.parametrize('jira_keys', [['PROJ-1'], []])
+def test_link_closing_issues_fetches_pr_once(
+    mock_environment, mock_jira_client, sync_to_jira_main, monkeypatch, capsys, jira_keys
+):
+    event_data = {
+        'action': 'opened',
+        'issue': {
+            'number': 13, 'title': 'PR', 'body': 'body',
+            'user': {'login': 'user'}, 'labels': [],
+            'html_url': 'https://github.com/espressif/esp-idf/pull/13',
+            'state': 'open', 'pull_request': True,
+        },
+    }
+    mock_environment.write_text(json.dumps(event_data))
+    monkeypatch.setenv('GITHUB_EVENT_NAME', 'issues')
+    monkeypatch.setenv('INPUT_LINK_CLOSING_ISSUES', 'true')
+
+    pr_details = MagicMock()
+    with (
+        patch('sync_jira_actions.sync_to_jira.get_pr_full', return_value=pr_details) as mock_get_pr_full,
+        patch('sync_jira_actions.sync_to_jira.find_and_link_pr_issues', return_value=jira_keys) as mock_link,
+        patch('sync_jira_actions.sync_to_jira.check_pr_approval_and_move') as mock_move,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
+        patch('sync_jira_actions.sync_to_jira.find_jira_issue', return_value=MagicMock(key='PROJ-13')),
+        patch('sync_jira_actions.sync_to_jira.handle_issue_opened'),
     ):
-        mock_get.return_value.json.return_value = issue_data
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
 
+    mock_get_pr_full.assert_called_once()
+    mock_link.assert_called_once_with(event_data['issue'], pr_details)
+    mock_move.assert_called_once()
+    assert mock_move.call_args[0][3] is pr_details
+    if jira_keys:
+        assert 'Skipping sync for Pull Request linked' in capsys.readouterr().out
+    else:
+        assert mock_move.call_args[0][2] == ['PROJ-13']
+
 
 # ── Collaborator skip ─────────────────────────────────────────────────────────
 
@@ -238,9 +286,8 @@ def test_pr_from_collaborator_skipped(mock_environment, mock_jira_client, sync_t
 
     with (
         patch('sync_jira_actions.sync_to_jira.handle_issue_opened') as mock_handler,
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=True),
     ):
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = True
         sync_to_jira_main()
     mock_handler.assert_not_called()
     assert 'collaborator' in capsys.readouterr().out
@@ -264,13 +311,31 @@ def test_issue_without_sync_label_skipped(mock_environment, mock_jira_client, sy
 
     with (
         patch('sync_jira_actions.sync_to_jira.handle_issue_opened') as mock_handler,
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
     ):
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
     mock_handler.assert_not_called()
 
 
+def test_issue_with_sync_label_synced(mock_environment, mock_jira_client, sync_to_jira_main, monkeypatch):
+    event_data = {
+        'action': 'opened',
+        'issue': {
+            'number': 22, 'title': 'Issue', 'body': 'body',
+            'user': {'login': 'user'}, 'labels': [{'name': 'bug'}, {'name': 'sync-to-jira'}],
+            'html_url': 'https://github.com/espressif/esp-idf/issues/22',
+            'state': 'open',
+        },
+    }
+    mock_environment.write_text(json.dumps(event_data))
+    monkeypatch.setenv('GITHUB_EVENT_NAME', 'issues')
+    monkeypatch.setenv('INPUT_SYNC_LABEL', 'sync-to-jira')
+
+    with patch('sync_jira_actions.sync_to_jira.handle_issue_opened') as mock_handler:
+        sync_to_jira_main()
+    mock_handler.assert_called_once()
+
+
 # ── no handler ────────────────────────────────────────────────────────────────
 
 def test_no_handler_for_event(mock_environment, mock_jira_client, sync_to_jira_main, monkeypatch, capsys):
@@ -285,8 +350,7 @@ def test_no_handler_for_event(mock_environment, mock_jira_client, sync_to_jira_m
     mock_environment.write_text(json.dumps(event_data))
     monkeypatch.setenv('GITHUB_EVENT_NAME', 'unknown_event')
 
-    with patch('sync_jira_actions.sync_to_jira.Github') as mock_gh:
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
+    with patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False):
         sync_to_jira_main()
     assert 'No handler for event' in capsys.readouterr().out
 
@@ -303,8 +367,7 @@ def test_no_handler_for_action(mock_environment, mock_jira_client, sync_to_jira_
     mock_environment.write_text(json.dumps(event_data))
     monkeypatch.setenv('GITHUB_EVENT_NAME', 'issues')
 
-    with patch('sync_jira_actions.sync_to_jira.Github') as mock_gh:
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
+    with patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False):
         sync_to_jira_main()
     assert "No handler" in capsys.readouterr().out
 
@@ -326,9 +389,8 @@ def test_issue_comment_created(mock_environment, mock_jira_client, sync_to_jira_
 
     with (
         patch('sync_jira_actions.sync_to_jira.handle_comment_created') as mock_handler,
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
     ):
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
     mock_handler.assert_called_once()
 
@@ -350,12 +412,12 @@ def test_payload_not_logged_by_default(mock_environment, mock_jira_client, sync_
     mock_environment.write_text(json.dumps(_base_event()))
     monkeypatch.setenv('GITHUB_EVENT_NAME', 'issues')
     monkeypatch.delenv('ACTIONS_RUNNER_DEBUG', raising=False)
+    monkeypatch.delenv('RUNNER_DEBUG', raising=False)
 
     with (
         patch('sync_jira_actions.sync_to_jira.handle_issue_opened'),
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
     ):
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
 
     out = capsys.readouterr().out
@@ -370,9 +432,8 @@ def test_payload_logged_when_debug_enabled(mock_environment, mock_jira_client, s
 
     with (
         patch('sync_jira_actions.sync_to_jira.handle_issue_opened'),
-        patch('sync_jira_actions.sync_to_jira.Github') as mock_gh,
+        patch('sync_jira_actions.sync_to_jira.is_collaborator', return_value=False),
     ):
-        mock_gh.return_value.get_repo.return_value.has_in_collaborators.return_value = False
         sync_to_jira_main()
 
     out = capsys.readouterr().out